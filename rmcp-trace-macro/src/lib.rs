@@ -1,6 +1,6 @@
 use proc_macro::TokenStream;
 use quote::quote;
-use syn::{parse_macro_input, ItemFn};
+use syn::{parse_macro_input, spanned::Spanned, ItemFn};
 
 /// A procedural macro that automatically captures input parameters and output values
 /// as trace span attributes for rmcp tool functions.
@@ -10,6 +10,9 @@ use syn::{parse_macro_input, ItemFn};
 /// 2. Capture the return value and record it as "output" before returning
 /// 3. Attach the stored trace context if available
 ///
+/// The generated body awaits the trace store, so only `async fn`s are supported;
+/// applying the macro to a synchronous function is a compile error.
+///
 /// Usage:
 /// ```rust
 /// #[trace_io]
@@ -25,6 +28,15 @@ use syn::{parse_macro_input, ItemFn};
 pub fn trace_io(_attr: TokenStream, item: TokenStream) -> TokenStream {
     let input = parse_macro_input!(item as ItemFn);
 
+    if input.sig.asyncness.is_none() {
+        return syn::Error::new(
+            input.sig.fn_token.span(),
+            "#[trace_io] can only be applied to async functions",
+        )
+        .to_compile_error()
+        .into();
+    }
+
     let vis = &input.vis;
     let sig = &input.sig;
     let fn_name = &sig.ident;
@@ -32,7 +44,6 @@ pub fn trace_io(_attr: TokenStream, item: TokenStream) -> TokenStream {
     let output = &sig.output;
     let block = &input.block;
     let attrs = &input.attrs;
-    let asyncness = &sig.asyncness;
     let generics = &sig.generics;
     let where_clause = &sig.generics.where_clause;
 
@@ -80,7 +91,7 @@ pub fn trace_io(_attr: TokenStream, item: TokenStream) -> TokenStream {
             input = tracing::field::Empty,
             output = tracing::field::Empty
         ))]
-        #vis #asyncness fn #fn_name #generics(#inputs) #output #where_clause {
+        #vis async fn #fn_name #generics(#inputs) #output #where_clause {
             #wrapped_body
         }
     };
@@ -1,4 +1,5 @@
 use once_cell::sync::Lazy;
+use opentelemetry::trace::TraceContextExt;
 use opentelemetry::Context;
 use std::collections::HashMap;
 use std::sync::Arc;
@@ -12,8 +13,23 @@ pub static TRACE_STORE: Lazy<Arc<RwLock<HashMap<String, Context>>>> =
 pub static CURRENT_TRACE: Lazy<Arc<RwLock<Option<Context>>>> =
     Lazy::new(|| Arc::new(RwLock::new(None)));
 
-/// Store a trace context for a session
-pub async fn store_trace_context(session_id: String, context: Context) {
+/// Store a trace context for a session.
+/// Returns `false` without taking any write lock when the session (and the
+/// fallback) already hold a context for the same span.
+pub async fn store_trace_context(session_id: String, context: Context) -> bool {
+    // Every HTTP request of a session normally carries the same traceparent,
+    // so most calls would rewrite identical entries.
+    {
+        let span_context = context.span().span_context().clone();
+        let same_span = |stored: &Context| stored.span().span_context() == &span_context;
+        let store = TRACE_STORE.read().await;
+        let current = CURRENT_TRACE.read().await;
+        if store.get(&session_id).is_some_and(same_span) && current.as_ref().is_some_and(same_span)
+        {
+            return false;
+        }
+    }
+
     let mut store = TRACE_STORE.write().await;
     let sid = session_id.clone();
     store.insert(session_id, context.clone());
@@ -23,6 +39,7 @@ pub async fn store_trace_context(session_id: String, context: Context) {
     *current = Some(context);
 
     tracing::debug!("Stored trace context for session: {}", sid);
+    true
 }
 
 /// Retrieve a trace context for a session
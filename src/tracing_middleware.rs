@@ -1,5 +1,7 @@
 use axum::extract::Request;
+use axum::http::HeaderMap;
 use axum::response::Response;
+use opentelemetry::trace::{SpanContext, SpanId, TraceContextExt, TraceFlags, TraceId, TraceState};
 use opentelemetry::Context;
 use std::future::Future;
 use std::pin::Pin;
@@ -14,6 +16,61 @@ use crate::trace_store;
 #[allow(dead_code)]
 pub struct TraceParentContext(pub Context);
 
+/// Parse a W3C `traceparent` header of the common form
+/// `00-<32 lowercase hex>-<16 lowercase hex>-<2 lowercase hex>`.
+/// Returns `None` for anything else so the caller can defer to the propagator.
+fn parse_traceparent(value: &str) -> Option<SpanContext> {
+    fn is_lower_hex(s: &str, len: usize) -> bool {
+        s.len() == len && s.bytes().all(|b| matches!(b, b'0'..=b'9' | b'a'..=b'f'))
+    }
+
+    let mut parts = value.split('-');
+    let (version, trace_id, span_id, flags) =
+        (parts.next()?, parts.next()?, parts.next()?, parts.next()?);
+    if parts.next().is_some()
+        || version != "00"
+        || !is_lower_hex(trace_id, 32)
+        || !is_lower_hex(span_id, 16)
+        || !is_lower_hex(flags, 2)
+    {
+        return None;
+    }
+
+    let flags = u8::from_str_radix(flags, 16).ok()?;
+    if flags > 2 {
+        return None;
+    }
+
+    let span_context = SpanContext::new(
+        TraceId::from_hex(trace_id).ok()?,
+        SpanId::from_hex(span_id).ok()?,
+        TraceFlags::new(flags) & TraceFlags::SAMPLED,
+        true,
+        TraceState::default(),
+    );
+    span_context.is_valid().then_some(span_context)
+}
+
+/// Extract the parent context from request headers.
+/// Plain version-00 `traceparent` headers without `tracestate` (what the
+/// FastMCP clients send) are parsed directly; everything else goes through
+/// the global propagator.
+fn extract_parent_context(headers: &HeaderMap) -> Context {
+    if !headers.contains_key("tracestate") {
+        if let Some(span_context) = headers
+            .get("traceparent")
+            .and_then(|value| value.to_str().ok())
+            .and_then(parse_traceparent)
+        {
+            return Context::current().with_remote_span_context(span_context);
+        }
+    }
+
+    opentelemetry::global::get_text_map_propagator(|prop| {
+        prop.extract(&opentelemetry_http::HeaderExtractor(headers))
+    })
+}
+
 #[derive(Clone, Default)]
 pub struct TracePropagationLayer;
 
@@ -56,9 +113,7 @@ where
         }
 
         // Extract trace context from headers
-        let parent_context = opentelemetry::global::get_text_map_propagator(|prop| {
-            prop.extract(&opentelemetry_http::HeaderExtractor(req.headers()))
-        });
+        let parent_context = extract_parent_context(req.headers());
 
         // Set current span parent
         // Ignore failure if the span context is already closed
@@ -79,9 +134,14 @@ where
             // If response has mcp-session-id header, store the trace context
             if let Some(session_id) = response.headers().get("mcp-session-id") {
                 if let Ok(session_str) = session_id.to_str() {
-                    trace_store::store_trace_context(session_str.to_string(), parent_context_clone)
-                        .await;
-                    tracing::info!("Stored trace context for session: {}", session_str);
+                    if trace_store::store_trace_context(
+                        session_str.to_string(),
+                        parent_context_clone,
+                    )
+                    .await
+                    {
+                        tracing::info!("Stored trace context for session: {}", session_str);
+                    }
                 }
             }
 
@@ -89,3 +149,111 @@ where
         })
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use opentelemetry::propagation::TextMapPropagator;
+    use opentelemetry_sdk::propagation::TraceContextPropagator;
+
+    const TRACE_ID: &str = "0af7651916cd43dd8448eb211c80319c";
+    const SPAN_ID: &str = "b7ad6b7169203331";
+
+    fn headers(traceparent: &str, tracestate: Option<&str>) -> HeaderMap {
+        let mut headers = HeaderMap::new();
+        headers.insert("traceparent", traceparent.parse().unwrap());
+        if let Some(tracestate) = tracestate {
+            headers.insert("tracestate", tracestate.parse().unwrap());
+        }
+        headers
+    }
+
+    /// The fast path must yield exactly what the stock propagator extracts.
+    fn assert_matches_propagator(headers: &HeaderMap) -> SpanContext {
+        // The fallback goes through the global propagator, as it does in main.
+        opentelemetry::global::set_text_map_propagator(TraceContextPropagator::new());
+
+        let fast = extract_parent_context(headers);
+        let stock =
+            TraceContextPropagator::new().extract(&opentelemetry_http::HeaderExtractor(headers));
+        assert_eq!(
+            fast.span().span_context(),
+            stock.span().span_context(),
+            "headers: {headers:?}"
+        );
+        stock.span().span_context().clone()
+    }
+
+    #[test]
+    fn sampled_and_unsampled_headers_match_propagator() {
+        for flags in ["01", "00"] {
+            let traceparent = format!("00-{TRACE_ID}-{SPAN_ID}-{flags}");
+            assert!(parse_traceparent(&traceparent).is_some());
+            assert!(assert_matches_propagator(&headers(&traceparent, None)).is_valid());
+        }
+    }
+
+    #[test]
+    fn uppercase_hex_matches_propagator() {
+        let traceparent = format!(
+            "00-{}-{}-01",
+            TRACE_ID.to_uppercase(),
+            SPAN_ID.to_uppercase()
+        );
+        assert!(parse_traceparent(&traceparent).is_none());
+        assert_matches_propagator(&headers(&traceparent, None));
+    }
+
+    #[test]
+    fn unsupported_flags_match_propagator() {
+        for flags in ["03", "ff"] {
+            let traceparent = format!("00-{TRACE_ID}-{SPAN_ID}-{flags}");
+            assert!(parse_traceparent(&traceparent).is_none());
+            assert_matches_propagator(&headers(&traceparent, None));
+        }
+    }
+
+    #[test]
+    fn all_zero_ids_match_propagator() {
+        for traceparent in [
+            format!("00-{}-{SPAN_ID}-01", "0".repeat(32)),
+            format!("00-{TRACE_ID}-{}-01", "0".repeat(16)),
+        ] {
+            assert!(parse_traceparent(&traceparent).is_none());
+            assert!(!assert_matches_propagator(&headers(&traceparent, None)).is_valid());
+        }
+    }
+
+    #[test]
+    fn trailing_dash_matches_propagator() {
+        let traceparent = format!("00-{TRACE_ID}-{SPAN_ID}-01-");
+        assert!(parse_traceparent(&traceparent).is_none());
+        assert_matches_propagator(&headers(&traceparent, None));
+    }
+
+    #[test]
+    fn version_ff_matches_propagator() {
+        let traceparent = format!("ff-{TRACE_ID}-{SPAN_ID}-01");
+        assert!(parse_traceparent(&traceparent).is_none());
+        assert_matches_propagator(&headers(&traceparent, None));
+    }
+
+    #[test]
+    fn short_ids_match_propagator() {
+        for traceparent in [
+            format!("00-{}-{SPAN_ID}-01", &TRACE_ID[..31]),
+            format!("00-{TRACE_ID}-{}-01", &SPAN_ID[..15]),
+        ] {
+            assert!(parse_traceparent(&traceparent).is_none());
+            assert_matches_propagator(&headers(&traceparent, None));
+        }
+    }
+
+    #[test]
+    fn tracestate_defers_to_propagator() {
+        let traceparent = format!("00-{TRACE_ID}-{SPAN_ID}-01");
+        let span_context =
+            assert_matches_propagator(&headers(&traceparent, Some("congo=t61rcWkgMzE")));
+        assert_eq!(span_context.trace_state().get("congo"), Some("t61rcWkgMzE"));
+    }
+}
@@ -31,24 +31,71 @@ fn default_days() -> u32 {
     3
 }
 
-#[derive(Debug, Serialize, Deserialize)]
+#[derive(Debug, Deserialize, Serialize, schemars::JsonSchema)]
+pub struct GetWeatherBundleArgs {
+    /// City name to get weather and forecast for
+    pub location: String,
+    /// Number of forecast days to include (0-7, 0 for current weather only)
+    #[serde(default)]
+    pub days: u32,
+}
+
+const WEATHER_CONDITIONS: [&str; 4] = ["Sunny", "Cloudy", "Rainy", "Partly Cloudy"];
+const FORECAST_CONDITIONS: [&str; 4] = ["Sunny", "Cloudy", "Rainy", "Stormy"];
+const MAX_FORECAST_DAYS: u32 = 7;
+
+// Response types are only ever serialized, so conditions borrow the static
+// tables above instead of allocating a String per entry.
+#[derive(Debug, Serialize)]
 pub struct Weather {
     pub location: String,
     pub temperature: i32,
-    pub condition: String,
+    pub condition: &'static str,
     pub humidity: i32,
     pub wind_speed: i32,
 }
 
-#[derive(Debug, Serialize, Deserialize)]
+#[derive(Debug, Serialize)]
 pub struct Forecast {
     pub day: i32,
     pub high: i32,
     pub low: i32,
-    pub condition: String,
+    pub condition: &'static str,
     pub precipitation_chance: i32,
 }
 
+#[derive(Debug, Serialize)]
+pub struct WeatherBundle {
+    pub weather: Weather,
+    pub forecast: Vec<Forecast>,
+}
+
+fn generate_weather(location: &str) -> Weather {
+    let mut rng = rand::thread_rng();
+
+    Weather {
+        location: location.to_string(),
+        temperature: rng.gen_range(15..=30),
+        condition: WEATHER_CONDITIONS[rng.gen_range(0..WEATHER_CONDITIONS.len())],
+        humidity: rng.gen_range(40..=80),
+        wind_speed: rng.gen_range(5..=25),
+    }
+}
+
+fn generate_forecast(days: u32) -> Vec<Forecast> {
+    let mut rng = rand::thread_rng();
+
+    (1..=days.min(MAX_FORECAST_DAYS))
+        .map(|day| Forecast {
+            day: day as i32,
+            high: rng.gen_range(20..=35),
+            low: rng.gen_range(10..=20),
+            condition: FORECAST_CONDITIONS[rng.gen_range(0..FORECAST_CONDITIONS.len())],
+            precipitation_chance: rng.gen_range(0..=100),
+        })
+        .collect()
+}
+
 #[derive(Clone)]
 pub struct WeatherService {
     tool_router: ToolRouter<WeatherService>,
@@ -80,16 +127,7 @@ impl WeatherService {
 
         info!(location = %args.location, "Handling get_weather request");
 
-        let mut rng = rand::thread_rng();
-        let weather_conditions = ["Sunny", "Cloudy", "Rainy", "Partly Cloudy"];
-
-        let weather = Weather {
-            location: args.location.clone(),
-            temperature: rng.gen_range(15..=30),
-            condition: weather_conditions[rng.gen_range(0..weather_conditions.len())].to_string(),
-            humidity: rng.gen_range(40..=80),
-            wind_speed: rng.gen_range(5..=25),
-        };
+        let weather = generate_weather(&args.location);
 
         debug!(?weather, "Generated weather response");
 
@@ -116,19 +154,7 @@ impl WeatherService {
             "Handling get_forecast request"
         );
 
-        let mut rng = rand::thread_rng();
-        let conditions = ["Sunny", "Cloudy", "Rainy", "Stormy"];
-        let days = args.days.min(7);
-
-        let forecast: Vec<Forecast> = (1..=days)
-            .map(|day| Forecast {
-                day: day as i32,
-                high: rng.gen_range(20..=35),
-                low: rng.gen_range(10..=20),
-                condition: conditions[rng.gen_range(0..conditions.len())].to_string(),
-                precipitation_chance: rng.gen_range(0..=100),
-            })
-            .collect();
+        let forecast = generate_forecast(args.days);
 
         debug!(
             forecast_len = forecast.len(),
@@ -139,6 +165,36 @@ impl WeatherService {
         // One line: record output and return
         crate::trace_utils::trace_rmcp_result(json!({ "items": forecast }))
     }
+
+    #[tool(description = "Get current weather and an optional forecast for a location in one call")]
+    #[instrument(skip(self, _request_context, params), fields(
+        input = tracing::field::Empty,
+        output = tracing::field::Empty
+    ))]
+    async fn get_weather_bundle(
+        &self,
+        _request_context: RequestContext<RoleServer>,
+        params: Parameters<GetWeatherBundleArgs>,
+    ) -> Result<CallToolResult, McpError> {
+        // One line: extract args and setup tracing
+        let args = crate::trace_utils::trace_rmcp_setup(params).await;
+
+        info!(
+            location = %args.location,
+            requested_days = args.days,
+            "Handling get_weather_bundle request"
+        );
+
+        let bundle = WeatherBundle {
+            weather: generate_weather(&args.location),
+            forecast: generate_forecast(args.days),
+        };
+
+        debug!(?bundle, "Generated weather bundle response");
+
+        // One line: record output and return
+        crate::trace_utils::trace_rmcp_result(bundle)
+    }
 }
 
 #[tool_handler]
@@ -156,7 +212,7 @@ impl ServerHandler for WeatherService {
                 website_url: None,
                 icons: None,
             },
-            instructions: Some("This server provides weather tools. Tools: get_weather (get current weather for a location), get_forecast (get weather forecast for multiple days).".to_string()),
+            instructions: Some("This server provides weather tools. Tools: get_weather (get current weather for a location), get_forecast (get weather forecast for multiple days), get_weather_bundle (current weather plus forecast in one call).".to_string()),
         }
     }
 }
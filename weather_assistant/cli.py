@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import logging
 import sys
@@ -12,18 +13,33 @@ from typing import Any, Iterable
 from dotenv import load_dotenv
 from fastmcp import Client
 from fastmcp.client import StreamableHttpTransport
-from langfuse import observe
 from opentelemetry import trace
 from opentelemetry.propagate import inject
 
 from weather_assistant.config.tracing import setup_tracing
 
+try:
+    # orjson raises a json.JSONDecodeError subclass, so callers catch the same error either way.
+    from orjson import loads as _json_loads
+except ImportError:  # orjson comes with the optional "speedups" extra
+    _json_loads = json.loads
+
+try:
+    # uvloop.run mirrors asyncio.run on a libuv-backed loop; uvloop.install() is deprecated.
+    from uvloop import run as _run_async  # pragma: no cover - needs the "speedups" extra, never on Windows
+except ImportError:
+    _run_async = asyncio.run
+
 
 logger = logging.getLogger(__name__)
 
 
 def extract_payload(result: Any) -> Any:
-    """Normalize CallToolResult-like responses into plain Python data."""
+    """Normalize CallToolResult-like responses into plain Python data.
+
+    Text content holding a JSON object or array is decoded here, once; any other
+    text is returned as a string.
+    """
     if result is None:
         return None
 
@@ -33,26 +49,36 @@ def extract_payload(result: Any) -> Any:
 
     content = getattr(result, "content", None)
     if content:
-        first = content[0] if len(content) > 0 else None
+        first = content[0]
         if first is None:
             return []
-        if hasattr(first, "text") and first.text is not None:
+        text = getattr(first, "text", None)
+        if text is None:
+            return first
+        # Peek at the first non-blank character so plain text never pays for a failed parse.
+        if text.lstrip()[:1] in ("{", "["):
             try:
-                return json.loads(first.text)
+                return _json_loads(text)
             except json.JSONDecodeError:
-                return first.text
-        return first
+                pass
+        return text
 
     return result
 
 
-@observe
 async def handle_weather_request(
     location: str,
     forecast_days: int = 3,
     backend_url: str = "http://localhost:8001/weather",
-) -> tuple[Any, Any | None]:
-    """Call MCP tools exposed by the Rust backend."""
+) -> Any:
+    """Call the ``get_weather_bundle`` MCP tool exposed by the Rust backend.
+
+    The result carries both the current weather and the forecast; use
+    :func:`extract_payload` and read its ``weather`` and ``forecast`` keys.
+
+    No span is created here: callers wrap the request in their own span (see
+    ``main``), whose context is what gets propagated to the backend.
+    """
 
     logger.debug(
         "Preparing MCP request",
@@ -70,20 +96,12 @@ async def handle_weather_request(
     transport = StreamableHttpTransport(url=backend_url, headers=carrier)
 
     async with Client(transport) as client:
-        # Get current weather
-        logger.debug("Calling get_weather tool")
-        weather_result = await client.call_tool("get_weather", {"location": location})
-
-        # Get forecast if requested
-        forecast_result: Any | None = None
-        if forecast_days > 0:
-            logger.debug("Calling get_forecast tool", extra={"forecast_days": forecast_days})
-            forecast_result = await client.call_tool(
-                "get_forecast", {"location": location, "days": forecast_days}
-            )
-        
+        # One round-trip for both current weather and forecast; days=0 skips the forecast.
+        logger.debug("Calling get_weather_bundle tool", extra={"forecast_days": forecast_days})
+        result = await client.call_tool("get_weather_bundle", {"location": location, "days": max(forecast_days, 0)})
+
         logger.debug("Received weather responses")
-        return weather_result, forecast_result
+        return result
 
 
 def _ensure_iterable_forecast(data: Any) -> Iterable[Any]:
@@ -97,7 +115,27 @@ def _ensure_iterable_forecast(data: Any) -> Iterable[Any]:
     return [data]
 
 
-def main(argv: list[str] | None = None) -> int:
+def _format_forecast(entries: Iterable[Any]) -> str:
+    """Render forecast entries as one block of text so it can be printed in a single write."""
+    lines: list[str] = []
+    for entry in entries:
+        high = entry.get("high")
+        low = entry.get("low")
+        condition = entry.get("condition")
+        precip = entry.get("precipitation_chance")
+        lines.append(f"  Day {entry.get('day', '?')}:")
+        if high is not None and low is not None:
+            lines.append(f"    Temps: high {high}°C / low {low}°C")
+        if condition is not None:
+            lines.append(f"    Condition: {condition}")
+        if precip is not None:
+            lines.append(f"    Chance of rain: {precip}%")
+    return "\n".join(lines)
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once; parse_args does not mutate it, so it is safe to reuse."""
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("location", help="City name to request weather information for")
     parser.add_argument(
@@ -117,8 +155,11 @@ def main(argv: list[str] | None = None) -> int:
         default="INFO",
         help="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
     )
+    return parser
 
-    args = parser.parse_args(argv)
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     logging.basicConfig(
         level=getattr(logging, args.log_level.upper(), logging.INFO),
@@ -146,7 +187,7 @@ def main(argv: list[str] | None = None) -> int:
         span.set_attribute("backend_url", args.backend_url)
 
         try:
-            weather_result, forecast_result = asyncio.run(
+            bundle_result = _run_async(
                 handle_weather_request(args.location, args.forecast_days, backend_url=args.backend_url)
             )
         except Exception as exc:  # pragma: no cover - defensive guard for CLI errors
@@ -156,13 +197,13 @@ def main(argv: list[str] | None = None) -> int:
             span.set_status(trace.StatusCode.ERROR)
             return 1
 
-    weather_data = extract_payload(weather_result) or {}
-    if isinstance(weather_data, str):
-        try:
-            weather_data = json.loads(weather_data)
-        except json.JSONDecodeError:
-            print(weather_data)
-            return 0
+    # extract_payload already decoded any JSON text; a string here is plain text.
+    bundle = extract_payload(bundle_result) or {}
+    if isinstance(bundle, str):
+        print(bundle)
+        return 0
+
+    weather_data = bundle.get("weather") or {}
 
     print(f"Current weather in {args.location}:")
     temperature = weather_data.get("temperature")
@@ -175,30 +216,12 @@ def main(argv: list[str] | None = None) -> int:
     if humidity is not None:
         print(f"  Humidity: {humidity}%")
 
-    if args.forecast_days > 0 and forecast_result is not None:
-        raw_forecast = extract_payload(forecast_result) or []
-        if isinstance(raw_forecast, str):
-            try:
-                raw_forecast = json.loads(raw_forecast)
-            except json.JSONDecodeError:
-                print("\nForecast:")
-                print(raw_forecast)
-                return 0
-
+    if args.forecast_days > 0:
+        raw_forecast = bundle.get("forecast") or []
         print(f"\n{args.forecast_days}-day forecast:")
-        for entry in _ensure_iterable_forecast(raw_forecast):
-            day = entry.get("day", "?")
-            high = entry.get("high")
-            low = entry.get("low")
-            condition = entry.get("condition")
-            precip = entry.get("precipitation_chance")
-            print(f"  Day {day}:")
-            if high is not None and low is not None:
-                print(f"    Temps: high {high}°C / low {low}°C")
-            if condition is not None:
-                print(f"    Condition: {condition}")
-            if precip is not None:
-                print(f"    Chance of rain: {precip}%")
+        forecast_text = _format_forecast(_ensure_iterable_forecast(raw_forecast))
+        if forecast_text:
+            print(forecast_text)
 
     return 0
 
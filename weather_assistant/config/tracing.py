@@ -8,14 +8,27 @@ from typing import Optional
 
 from langfuse import Langfuse
 from opentelemetry import propagate, trace
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 
+logger = logging.getLogger(__name__)
+
 _LANGFUSE_CLIENT: Optional[Langfuse] = None
 _TRACING_INITIALIZED = False
 
+# Export in smaller, more frequent batches than the SDK defaults (512 spans
+# every 5s) so short-lived CLI runs have little left to flush at exit.
+_OTLP_MAX_EXPORT_BATCH_SIZE = 256
+_OTLP_SCHEDULE_DELAY_MILLIS = 1000
+# Deadline for each export request, including those made while the provider's
+# own atexit shutdown drains the queue, so an unreachable collector cannot
+# stall process exit indefinitely.
+_OTLP_EXPORT_TIMEOUT_SECONDS = 2.0
+
 
 def setup_tracing():
     """Configure OpenTelemetry with Langfuse integration."""
@@ -25,8 +38,10 @@ def setup_tracing():
     if _TRACING_INITIALIZED:
         return _LANGFUSE_CLIENT
 
-    # Check if TracerProvider is already set by Langfuse SDK
-    if trace.get_tracer_provider() is not trace.ProxyTracerProvider():
+    # Check if TracerProvider is already set by Langfuse SDK. Until a provider is
+    # installed the API hands out its module-level proxy, so test the type: an
+    # identity check against a freshly constructed proxy is always true.
+    if not isinstance(trace.get_tracer_provider(), trace.ProxyTracerProvider):
         # Tracing already initialized
         _TRACING_INITIALIZED = True
         return _LANGFUSE_CLIENT
@@ -41,6 +56,18 @@ def setup_tracing():
     provider = TracerProvider(resource=resource)
     trace.set_tracer_provider(provider)
 
+    # Optionally mirror spans to an OTLP collector (e.g. Jaeger). Export runs on
+    # the batch processor's worker thread, never on the request path.
+    if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") or os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT"):
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                OTLPSpanExporter(timeout=_OTLP_EXPORT_TIMEOUT_SECONDS),
+                max_export_batch_size=_OTLP_MAX_EXPORT_BATCH_SIZE,
+                schedule_delay_millis=_OTLP_SCHEDULE_DELAY_MILLIS,
+            )
+        )
+        logger.info("OTLP span export enabled")
+
     # Get Langfuse configuration
     public_key = os.getenv("LANGFUSE_PUBLIC_KEY")
     secret_key = os.getenv("LANGFUSE_SECRET_KEY")
@@ -55,7 +82,6 @@ def setup_tracing():
             host=host,
             debug=os.getenv("LANGFUSE_DEBUG", "false").lower() == "true"
         )
-        logger = logging.getLogger(__name__)
         logger.info(f"Langfuse client initialized for {host}")
     else:
         _LANGFUSE_CLIENT = None